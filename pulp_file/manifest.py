@@ -2,11 +2,14 @@ from collections import namedtuple
 
 from gettext import gettext as _
 
-from re import fullmatch
+import re
 
 
 Line = namedtuple("Line", ("number", "content"))
 
+relative_path_re = re.compile(r"^[^/]+(/[^/]+)*$")
+digest_re = re.compile(r"^[0-9a-fA-F]+$")
+
 
 class Entry:
     """
@@ -22,6 +25,8 @@ class Entry:
 
     """
 
+    __slots__ = ("relative_path", "digest", "size")
+
     def __init__(self, relative_path, size, digest):
         """
         Create a new Entry.
@@ -56,8 +61,8 @@ class Entry:
             relative_path, digest, size = [s.strip() for s in line.content.rsplit(",", maxsplit=2)]
         if (
             not all_parts
-            or not fullmatch(r"^[^/]+(/[^/]+)*$", relative_path)
-            or not fullmatch(r"^[0-9a-fA-F]+$", digest)
+            or not relative_path_re.fullmatch(relative_path)
+            or not digest_re.fullmatch(digest)
             or not size.isdigit()
         ):
             raise ValueError(
@@ -78,10 +83,9 @@ class Entry:
             str: format: "<relative_path>,<digest>,<size>"
 
         """
-        fields = [self.relative_path, self.digest]
         if isinstance(self.size, int):
-            fields.append(str(self.size))
-        return ",".join(fields)
+            return f"{self.relative_path},{self.digest},{self.size}"
+        return f"{self.relative_path},{self.digest}"
 
 
 class Manifest:
@@ -142,7 +146,4 @@ class Manifest:
 
         """
         with open(self.relative_path, "w+") as fp:
-            for entry in entries:
-                line = str(entry)
-                fp.write(line)
-                fp.write("\n")
+            fp.writelines(f"{entry}\n" for entry in entries)
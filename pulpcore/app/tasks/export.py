@@ -5,6 +5,7 @@ import os.path
 import subprocess
 import tarfile
 
+from contextlib import suppress
 from distutils.util import strtobool
 from gettext import gettext as _
 from glob import glob
@@ -91,11 +92,13 @@ def _export_to_file_system(path, relative_paths_to_artifacts, method=FS_EXPORT_M
 
         if method == FS_EXPORT_METHODS.SYMLINK:
             src = os.path.join(settings.MEDIA_ROOT, artifact.file.name)
-            os.path.lexists(dest) and os.unlink(dest)
+            with suppress(FileNotFoundError):
+                os.unlink(dest)
             os.symlink(src, dest)
         elif method == FS_EXPORT_METHODS.HARDLINK:
             src = os.path.join(settings.MEDIA_ROOT, artifact.file.name)
-            os.path.lexists(dest) and os.unlink(dest)
+            with suppress(FileNotFoundError):
+                os.unlink(dest)
             os.link(src, dest)
         elif method == FS_EXPORT_METHODS.WRITE:
             with open(dest, "wb") as f, artifact.file as af:
@@ -435,7 +438,7 @@ def pulp_export(exporter_pk, params):
             except Exception:
                 # no matter what went wrong, we can't trust the file we created.
                 # Delete it if it exists and pass the problem up.
-                if os.path.exists(tarfile_fp):
+                with suppress(FileNotFoundError):
                     os.remove(tarfile_fp)
                 raise
             # compute the hash
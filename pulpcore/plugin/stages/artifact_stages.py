@@ -1,5 +1,6 @@
 import asyncio
 from collections import defaultdict
+from contextlib import suppress
 from gettext import gettext as _
 import logging
 
@@ -287,7 +288,7 @@ class ArtifactSaver(Stage):
                 ):
                     d_artifact.artifact = artifact
                     # Delete the downloaded tmp file if it still exists to clear up space
-                    if await aos.path.exists(tmp_file_path):
+                    with suppress(FileNotFoundError):
                         await aos.remove(tmp_file_path)
 
             for d_content in batch: